@@ -7,8 +7,8 @@
     and output.
 
     Functions:
-        lines() -> generator: Yields each line of a file, stripping them and
-            ignoring empty lines.
+        lines() -> generator: Yields each line of a file or path, stripping
+            them and ignoring empty lines.
 
     [FUTURE]
     Functions:
@@ -21,26 +21,73 @@
 
 
     Created:        23 Sep 2020
-    Last modified:  23 Sep 2020
+    Last modified:  15 Oct 2026
         - Ready for version 0.1.0
+        - lines() reads the file lazily instead of loading it whole.
+        - lines() also accepts paths, and reads files with a bigger buffer.
 
 """
+from functools import partial
+import os
+
+
+#
+# Defines
+#
+BUFFER_SIZE = 1 << 17       # Default buffer size when reading files.
+CHUNK_SIZE = 1 << 20        # Characters read at once.
+
 
 #
 # Functions
 #
-def lines (file, splitchar='\n', jump_empties=False):
+def _pieces (file, splitchar):
+    """Yields the raw pieces of a reading-mode file split by `splitchar`, just
+    like `file.read().split(splitchar)`, but reading it lazily.
+
+    """
+    # Not iterating the file, as it also splits on '\r' with `newline=''`.
+    # Chunks are only joined once a separator shows up, so a piece longer
+    # than a chunk is not copied again on every read.
+    overlap = len(splitchar) - 1
+    pending = list()
+    edge = ''       # Last characters read, where a separator may start.
+    for chunk in iter(partial(file.read, CHUNK_SIZE), ''):
+        pending.append(chunk)
+        seen = edge + chunk
+        edge = seen[-overlap:] if overlap else ''
+        if splitchar not in seen:
+            continue
+        pieces = ''.join(pending).split(splitchar)
+        pending = [pieces.pop()]
+        yield from pieces
+    yield ''.join(pending)
+
+def lines (file, splitchar='\n', jump_empties=False, buffering=BUFFER_SIZE):
     """Given a reading-mode file, it yields each line of it, stripped.
 
+    `file` may also be a path, in which case the file is opened as UTF-8 text
+    with a buffer of `buffering` bytes, and closed when the lines run out. An
+    already opened text file will have its read chunks raised to that size.
+
     You can provide a different character or substring to split the file using
     the keyword `splitchar`.
 
     It yields None if a line is empty; although you can make it directly ignore
     them by setting `jump_empties` to True.
 
+    The file is read as it is iterated, so it is never loaded whole in memory.
+
     """
-    for ln in file.read().split(splitchar):
-        ln = ln.strip()
+    if isinstance(file, (str, bytes, os.PathLike)):
+        with open(file, encoding='utf-8', buffering=buffering) as f:
+            yield from lines(f, splitchar, jump_empties, buffering)
+        return
+    if getattr(file, '_CHUNK_SIZE', buffering) < buffering:
+        file._CHUNK_SIZE = buffering        # TextIOWrapper decoding chunks.
+
+    for ln in _pieces(file, splitchar):
+        ln = ln.strip()     # Same object back if there is nothing to strip.
         if not ln and jump_empties:
             continue
         else:
@@ -18,10 +18,17 @@
 
 
     Created:        18 Sep 2020
-    Last modified:  18 Sep 2020
+    Last modified:  15 Oct 2026
         - Ready for version 0.1.0
+        - normalize() sums the vector only once.
+        - dot_product() multiplies and adds two vectors in a single pass.
+        - vector_product() multiplies all the lists in a single pass.
 
 """
+from functools import reduce
+from itertools import repeat
+from operator import mul
+
 
 #
 # Functions
@@ -33,10 +40,8 @@ def normalize (vector):
 
     """
     if all((isinstance(n, (int, float)) and (n >= 0)) for n in vector):
-        out = list()
-        for val in vector:
-            out.append(val/sum(vector))
-        return out
+        total = sum(vector)
+        return [val/total for val in vector]
     else:
         raise TypeError("normalize() values must be naturals and >= 0")
 
@@ -76,36 +81,34 @@ def vector_product (v, w, *args):
     `w` and `args` must always be lists of numeric values.
 
     If `v` is an integer, it will multiply it for each value in `w`, returning
-    another list. If `args` are provided, it will call itself again with the
-    new list as first argument.
+    another list. If `args` are provided, that list is then multiplied by them
+    as explained below, all in the same pass.
 
     If `v` is a list of values, then all the following lists must have the same
     length, and it will perform a simetrical multiplication, so each index will
     be multiplied and return a new list with the same length.
 
-    Raises ValueError exception if the length or the lists are not equal.
+    Raises ValueError exception if the length or the lists are not equal, and
+    TypeError if `v` is neither a number nor a list.
 
     """
     if isinstance(v, (int, float)):
-        # v * [w0 w1 ... wN] operation.
-        ans = [v*n for n in w]
-        if args:
-            return vector_product(ans, *args)
-        else:
-            return ans
+        # v * [w0 w1 ... wN] * ...
+        vectors = (w, *args)
+        factors = (repeat(v), *vectors)
     elif isinstance(v, (list, tuple)):
         # [v0 v1 ... vN] * [w0 w1 ... wN] * ...
-        if (len(w) == len(v)) and all(len(x) == len(v) for x in args):
-            ans = list()
-            for i in range(len(v)):
-                n = v[i] * w[i]
-                for arg in args:
-                    n *= arg[i]
-                ans.append(n)
-            return ans
-        else:
-            raise ValueError("vector_product() needs all the lists to have the"\
-                             " same length")
+        vectors = factors = (v, w, *args)
+    else:
+        raise TypeError("vector_product() first value must be a number or a "\
+                        "list")
+
+    if any(len(x) != len(w) for x in vectors):
+        raise ValueError("vector_product() needs all the lists to have the"\
+                         " same length")
+    if len(factors) == 2:
+        return list(map(mul, *factors))
+    return [reduce(mul, ns) for ns in zip(*factors)]
 
 def dot_product (v, w, *args):
     """Performs the dot multiplication of two or more lists of numeric values
@@ -113,6 +116,12 @@ def dot_product (v, w, *args):
     Raises ValueError exception if the length of the lists are not equal.
 
     """
+    if isinstance(v, (list, tuple)) and not args:
+        # [v0 v1 ... vN] . [w0 w1 ... wN], without an intermediate list.
+        if len(v) != len(w):
+            raise ValueError("dot_product() needs all the lists to have the "\
+                             "same length")
+        return sum(map(mul, v, w))
     try:
         vector = vector_product(v, w, *args)
         return sum(vector)
@@ -23,13 +23,30 @@
 
 
     Created:        17 Sep 2020
-    Last modified:  21 Sep 2020
+    Last modified:  15 Oct 2026
         - Ready for version 0.1.0
         - Changed the repr() representation.
+        - RandomList.choice() now draws from a cached alias table.
+        - RandomList.choice() no longer rebuilds the remaining elements on
+        every draw when most of them were excluded.
+        - RandomList keeps the repeated elements in a set, when possible.
+        - RandomList.append() no longer copies the whole list.
+        - Added RandomList.extend().
+        - RandomList.remove() and pop() move the last item to the freed place.
+        - RandomList.age() ages and normalizes the weights in a single pass.
+        - RandomList stores its elements and weights in two separate lists.
+        - RandomList.items is now a tuple, so it cannot be changed in place.
+        - biased_choice() no longer builds a RandomList.
+        - RandomList keeps the extra weights given in a deque.
+        - RandomList.index() now takes into account `start` and `end`.
+        - RandomList.sort() can sort by elements or weights with `by`.
 
 """
+from bisect import bisect, insort
+from collections import deque
 from collections.abc import Generator
-from itertools import zip_longest
+from itertools import accumulate
+from operator import itemgetter
 import random
 
 
@@ -37,6 +54,8 @@ import random
 # Defines
 #
 DEFAULT_AGING_COEF = 2
+MAX_REJECTED_DRAWS = 8      # Draws to try before rebuilding a table.
+SORT_KEYS = {'elem': itemgetter(0), 'weight': itemgetter(1)}
 NO_ITEMS_LEFT_MSG = "RandomList has no more items to choose from " \
                     "(perhaps you need to reset the repeated cache?)"
 
@@ -59,9 +78,54 @@ def biased_choice (*args, **kwargs):
 
     It will return the randomly chosen element, without its weight.
 
+    Other RandomList options are accepted, but they do not change a single
+    choice, so no RandomList is built for it.
+
+    To choose many times from the same items, build a RandomList once and use
+    its `choice` method instead, as it keeps its sampling tables between calls
+    for as long as the weights do not change.
+
+    """
+    elems, weights, _ = _parse_items(args, kwargs.get('key'))
+    if max(weights, default=0.0) <= 0.0:
+        raise NoItemsLeftException(NO_ITEMS_LEFT_MSG)
+    return random.choices(elems, weights)[0]
+
+def _parse_items (args, key=None):
+    """Parses the item list given to RandomList or `biased_choice`.
+
+    Returns a list with the elements, another with their weights, and a third
+    with the extra weights given, if any.
+
+    Raises ValueError if any weight is negative.
+
     """
-    _rl = RandomList(*args, **kwargs)
-    return _rl.choice()[-1]
+    elems, weights, extra = list(), list(), list()
+    if len(args) == 2:
+        # List of items AND list of weights.
+        elems = list(args[0])
+        weights = [float(n) for n in args[1][:len(elems)]]
+        extra = [float(w) for w in args[1][len(elems):]]
+        weights += [0.0] * (len(elems) - len(weights))
+
+    elif len(args) == 1:
+        # List of tuples, where raw items are weighted by the key if there
+        # is one, or with uniform probability if not.
+        items = list(args[0])
+        uniform = 1/len(items) if items else 0.0
+        if key is not None:
+            pairs = [x if isinstance(x, (tuple, list)) else (x, key(x))
+                     for x in items]
+        else:
+            pairs = [x if isinstance(x, (tuple, list)) else (x, uniform)
+                     for x in items]
+        elems = [x[0] for x in pairs]
+        weights = [float(x[1]) for x in pairs]
+
+    # Checks weights are correct
+    if weights and min(weights) < 0:
+        raise ValueError("RandomList requires positive weights")
+    return elems, weights, extra
 
 
 #
@@ -79,7 +143,9 @@ class RandomList (object):
     such as biased choices, normalization, random choice with elimination, etc.
 
     Public attributes:
-        items (list[tuple]): List with all the items with their weights.
+        items (tuple[tuple]): Tuple with all the items with their weights.
+            Each access builds it again, so it cannot be changed in place; it
+            can only be replaced as a whole.
         key (callable): Key applied to an item to get its weight.
 
     Public methods:
@@ -97,6 +163,7 @@ class RandomList (object):
 
         append() -> None: Appends a new element to the list, with many forms to
             give it its weight.
+        extend() -> None: Appends many new elements to the list at once.
         remove() -> None: Removes the first item whichs element matches the
             given.
         pop() -> Item: Removes the item in the given position and returns it.
@@ -150,41 +217,30 @@ class RandomList (object):
             - aging_coef (float): Changes the aging coeficent, by default, 2.
 
         """
-        self.items = list()             # List of [item, weight].
         self.key = kwargs.get('key')    # Possible weights key generator.
+        self._elems = list()            # Elements in the list.
+        self._weights = list()          # Weight of each element.
+        self._lookup = None             # Element to its positions, if built.
 
-        self._stored_weights = (_ for _ in ())
+        self._stored_weights = deque()  # Weights for future elements.
         self._last = list()             # List of last chosen items.
         self._no_repeat = False
-        self._repeated_cache = list()
+        self._repeated_cache = set()    # Set (or list) of chosen elements.
         self._always_age = False
         self._aging_coef = DEFAULT_AGING_COEF           # Aging coeficient.
-        self._backup = None                             # For aging backup.
+        self._backup = None             # Elements and weights before aging.
 
-        # Check arguments and build
-        if len(args) == 2:
-            # List of items AND list of weights.
-            items = args[0]
-            weights = [float(n) for n in args[1][:len(items)]]
-            self._stored_weights = (float(w) for w in args[1][len(items):])
-            for item, weight in zip_longest(items, weights):
-                self.items.append([item, weight or 0.0])
-
-        elif len(args) == 1:
-            for item in args[0]:
-                if isinstance(item, (tuple, list)):
-                    # List of tuples
-                    self.items.append([item[0], float(item[1])])
-                elif self.key is not None:
-                    # Raw list and key
-                    self.items.append([item, float(self.key(item))])
-                else:
-                    # Uniform probability
-                    self.items.append([item, 1/len(args[0])])
+        self._dirty = True              # Weights changed since last tables.
+        self._cum_elems = list()        # Elements with positive weights.
+        self._cum_weights = list()      # Their cumulative weights.
+        self._alias_q = list()          # Alias table probabilities.
+        self._alias_p = list()          # Alias table primary positions.
+        self._alias_a = list()          # Alias table alias positions.
+        self._cum_table = None          # Remaining positions and cum weights.
 
-        # Checks weights are correct
-        if not all(w >= 0 for w in self.weights()):
-            raise ValueError("RandomList requires positive weights")
+        # Check arguments and build
+        self._elems, self._weights, extra = _parse_items(args, self.key)
+        self._stored_weights.extend(extra)
 
         # Configure
         self.configure(**kwargs)
@@ -192,13 +248,80 @@ class RandomList (object):
     def get_generator (self):
         """Returns a RandomGenerator created from this list"""
         _rg = RandomGenerator()
-        _rg.items = self.items.copy()
+        _rg.items = self.items
         _rg.key = self.key
         _rg._no_repeat = self._no_repeat
         _rg._always_age = self._always_age
         _rg._aging_coef = self._aging_coef
         return _rg
 
+    @property
+    def items (self):
+        """Tuple of tuples with each element and its weight"""
+        return tuple(zip(self._elems, self._weights))
+
+    @items.setter
+    def items (self, items):
+        self._elems = [x[0] for x in items]
+        self._weights = [x[1] for x in items]
+        self._reorder()
+
+    def _reorder (self):
+        """Drops the caches that depend on the positions of the elements.
+
+        It must be called whenever the elements are replaced or reordered.
+
+        """
+        self._lookup = None
+        self._dirty = True
+
+    def _ensure_lookup (self):
+        """Builds the dictionary from elements to their sorted positions, if it
+        is not built yet. Once built, it is kept up to date by the methods that
+        add or remove elements.
+
+        Returns False if some element in the list is not hashable.
+
+        """
+        if self._lookup is None:
+            self._lookup = dict()
+            self._track(0)
+        return self._lookup is not False
+
+    def _track (self, start):
+        """Adds the positions of the elements from `start` on to the lookup
+        dictionary, if it is built.
+
+        """
+        if isinstance(self._lookup, dict):
+            try:
+                for pos in range(start, len(self._elems)):
+                    self._lookup.setdefault(self._elems[pos], []).append(pos)
+            except TypeError:
+                self._lookup = False        # Unhashable elements.
+
+    def _position (self, req):
+        """Returns the position of the first occurrence of `req` in the list.
+
+        Positions are looked up in a dictionary built on demand, unless the
+        elements are not hashable. Raises ValueError if `req` is not found.
+
+        """
+        self._ensure_lookup()
+        try:
+            if self._lookup is not False:
+                return self._lookup[req][0]
+        except KeyError:
+            raise ValueError(f"RandomList element {req!r} not in list") \
+                from None
+        except TypeError:
+            pass
+        try:
+            return self._elems.index(req)
+        except ValueError:
+            raise ValueError(f"RandomList element {req!r} not in list") \
+                from None
+
 
     # Generic list methods and extended list methods
     def append (self, item, weight=None):
@@ -210,35 +333,117 @@ class RandomList (object):
 
         """
         if weight is None:
-            try:
-                weight = next(self._stored_weights)
-            except StopIteration:
-                if self.key is not None:
-                    weight = float(self.key(item))
-                else:
-                    weight = 0.0
+            weight = self._new_weight(item)
         if weight < 0:
             raise ValueError("RandomList requires positive weights")
-        self.items.append([item, weight])
-        self.configure()
-
-    def remove (self, req):
-        """Removes the first item of the list that matches given `item`"""
-        _copy = self.items.copy()
-        _removed = None
-        for elem in _copy:
-            if elem[0] == req:
-                self.items.remove(elem)
-                _removed = elem
-                break
-        else:
+        self._elems.append(item)
+        self._weights.append(weight)
+        if self._backup:
+            self._backup[0].append(item)
+            self._backup[1].append(weight)
+        self._track(len(self._elems) - 1)
+        self._dirty = True
+
+    def extend (self, items, weights=None):
+        """Appends many new elements to the list at once.
+
+        If `weights` is given, each element will take the weight in its same
+        position. Elements without weight get it the same way as in `append`.
+        If there are more weights than elements, the remaining ones are stored
+        for future elements, as the constructor does.
+
+        """
+        items = list(items)
+        weights = [float(w) for w in (weights or ())]
+        if not all(w >= 0 for w in weights):
+            raise ValueError("RandomList requires positive weights")
+        weights, extra = weights[:len(items)], weights[len(items):]
+        new = [self._new_weight(item) for item in items[len(weights):]]
+        if not all(w >= 0 for w in new):
+            raise ValueError("RandomList requires positive weights")
+        weights += new
+        self._stored_weights.extend(extra)
+        start = len(self._elems)
+        self._elems.extend(items)
+        self._weights.extend(weights)
+        if self._backup:
+            self._backup[0].extend(items)
+            self._backup[1].extend(weights)
+        self._track(start)
+        self._dirty = True
+
+    def _new_weight (self, item):
+        """Returns the weight for a new `item` appended without one.
+
+        It is taken from the stored values, if there are some left; if not, it
+        is generated with the key; if there is none, it will be 0.
+
+        """
+        try:
+            return self._stored_weights.popleft()
+        except IndexError:
+            if self.key is not None:
+                return float(self.key(item))
+            else:
+                return 0.0
+
+    def remove (self, req, stable=False):
+        """Removes the first item of the list that matches given `item`.
+
+        The last item of the list takes its place, so the order of the list is
+        not kept, unless `stable` is set to True.
+
+        """
+        try:
+            pos = self._position(req)
+        except ValueError:
             raise ValueError(f"RandomList could not remove element {req!r}: "\
-                             f"it does not exist")
-        return _removed
+                             f"it does not exist") from None
+        return self._pop_at(pos, stable)
+
+    def pop (self, pos=-1, stable=False):
+        """Pops the last item of the list, or the `i` one, if given.
+
+        The last item of the list takes its place, so the order of the list is
+        not kept, unless `stable` is set to True.
+
+        """
+        return self._pop_at(pos, stable)[0]
 
-    def pop (self, pos=-1):
-        """Pops the last item of the list, or the `i` one, if given"""
-        return self.remove(self.items[pos][0])[0]
+    def _pop_at (self, pos, stable=False):
+        """Removes the item at `pos` and returns it.
+
+        Instead of shifting all the following items, the last one is moved to
+        its place, so it takes constant time. If `stable` is True, items are
+        shifted instead.
+
+        """
+        elems, weights = self._elems, self._weights
+        last = len(elems) - 1
+        pos = range(last + 1)[pos]      # Also raises IndexError.
+        removed = (elems[pos], weights[pos])
+        if stable and pos != last:
+            del elems[pos]
+            del weights[pos]
+            self._lookup = None         # Following positions changed.
+            self._dirty = True
+            return removed
+
+        moved = (elems.pop(), weights.pop())
+        if pos != last:
+            elems[pos], weights[pos] = moved
+
+        if isinstance(self._lookup, dict):
+            positions = self._lookup[removed[0]]
+            positions.remove(pos)
+            if not positions:
+                del self._lookup[removed[0]]
+            if pos != last:
+                positions = self._lookup[moved[0]]
+                positions.pop()         # It was the last position.
+                insort(positions, pos)
+        self._dirty = True
+        return removed
 
     def clear (self):
         """Clear the items list, only the items list"""
@@ -247,41 +452,58 @@ class RandomList (object):
     def clear_all (self):
         """Clear the items list, the stored values, and the key"""
         self.items = list()
-        self._stored_weights = (_ for _ in ())
+        self._stored_weights = deque()
         self.key = None
 
     def index (self, req, start=None, end=None):
         """Returns a zero-based index in the list for the first item whose
         value is equal to `req`.
 
-        If `start` and/or `stop` are given, they'll be used to slice the list.
+        If `start` and/or `end` are given, they'll be used to slice the list.
 
         """
-        return [elem[0] for elem in self.items].index(req)
+        if start is None and end is None:
+            return self._position(req)
+        start, end, _ = slice(start, end).indices(len(self._elems))
+        try:
+            return self._elems.index(req, start, end)
+        except ValueError:
+            raise ValueError(f"RandomList element {req!r} not in list") \
+                from None
 
     def count (self, req):
         """Returns the number of times `req` appears in the list."""
-        return [elem[0] for elem in self.items].count(req)
+        return self._elems.count(req)
 
-    def sort (self, key=None, reverse=False):
+    def sort (self, key=None, reverse=False, by=None):
         """Sorts the items in the list given a key.
 
         Keep in mind that [0] position is the list object, and [1] its weight.
 
+        To sort just by one of them, you can set `by` to 'elem' or 'weight'
+        instead of giving a key, which is faster. Raises ValueError if it is
+        something else.
+
         """
-        self.items.sort(key=key, reverse=reverse)
+        if by is not None:
+            try:
+                key = SORT_KEYS[by]
+            except KeyError:
+                raise ValueError(f"RandomList cannot sort by {by!r}, only by "\
+                                 f"'elem' or 'weight'") from None
+        self.items = sorted(self.items, key=key, reverse=reverse)
 
     def copy (self):
         """Returns a copy of the items in the list, with its weights also"""
-        return self.items.copy()
+        return list(self.items)
 
     def elems (self):
         """Returns a copy of the list of elements in the list, without weights"""
-        return [x[0] for x in self.items]
+        return self._elems.copy()
 
     def weights (self):
         """Returns a copy of the list of weights in the list, without elems"""
-        return [x[1] for x in self.items]
+        return self._weights.copy()
 
     def weight_of (self, req):
         """Returns the weight of the first occurrence of the requested element.
@@ -289,30 +511,112 @@ class RandomList (object):
         If it is not found, it will raise a ValueError.
 
         """
-        _ret = None
-        for elem, weight in self.items:
-            if elem == req:
-                _ret = weight
-                break
-        else:
-            raise ValueError(f"RandomList element {req!r} not in list")
-        return _ret
+        return self._weights[self._position(req)]
 
     def at (self, pos):
         """Returns the element at the position `pos`"""
-        return self.items[pos][0]
+        return self._elems[pos]
 
     def __getitem__ (self, pos):
         return self.at(pos)
 
     def __len__ (self):
-        return len(self.items)
+        return len(self._elems)
 
 
     # Random operations methods and extended random operations
+    def _ensure_tables (self):
+        """Rebuilds the sampling tables if the weights changed since they were
+        built. Zero-weighted items are left out of them.
+
+        The cumulative weights are used to draw many elements at once with
+        `random.choices`. The alias table, built with Vose's algorithm, is used
+        to draw them one by one: each column holds one item, the probability
+        of keeping it, and the position of the item to return otherwise.
+
+        """
+        if not self._dirty:
+            return
+        elems, weights = self._elems, self._weights
+        primary = [i for i, weight in enumerate(weights) if weight > 0.0]
+        self._cum_elems = [elems[i] for i in primary]
+        self._cum_weights = list(accumulate(weights[i] for i in primary))
+
+        n = len(primary)
+        total = self._cum_weights[-1] if n else 0.0
+        scaled = [weights[i] * n / total for i in primary]
+        prob = [1.0] * n
+        alias = primary.copy()
+        small = [c for c in range(n) if scaled[c] < 1.0]
+        large = [c for c in range(n) if scaled[c] >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = primary[l]
+            scaled[l] = (scaled[l] + scaled[s]) - 1.0
+            if scaled[l] < 1.0:
+                small.append(l)
+            else:
+                large.append(l)
+        # Columns left in any stack are full (or off by rounding errors).
+        self._alias_q = prob
+        self._alias_p = primary
+        self._alias_a = alias
+        self._cum_table = None
+        self._dirty = False
+
+    def _draw (self, excluded=None):
+        """Randomly chooses one element from the list, based on its weight.
+
+        Elements in `excluded` are never returned. They are skipped by drawing
+        again from the alias table, which is constant-time per draw; if that
+        keeps failing, it draws from the cumulative weights of the remaining
+        elements instead, which are kept for the following draws.
+
+        Raises NoItemsLeftException if there is nothing left to choose from.
+
+        """
+        self._ensure_tables()
+        excluded = excluded or ()
+        elems = self._elems
+        prob, primary, alias = self._alias_q, self._alias_p, self._alias_a
+        n = len(prob)
+        if n:
+            for _ in range(MAX_REJECTED_DRAWS):
+                col = int(random.random() * n)
+                if random.random() < prob[col]:
+                    choice = elems[primary[col]]
+                else:
+                    choice = elems[alias[col]]
+                if choice not in excluded:
+                    return choice
+
+        # Most of the weight is excluded, so draw by bisecting the cumulative
+        # weights of the remaining elements. They are only computed again when
+        # the elements excluded since then make these draws fail too.
+        if self._cum_table is not None:
+            positions, cum = self._cum_table
+            for _ in range(MAX_REJECTED_DRAWS):
+                i = bisect(cum, random.random() * cum[-1], 0, len(cum) - 1)
+                choice = elems[positions[i]]
+                if choice not in excluded:
+                    return choice
+
+        positions = [i for i in primary if elems[i] not in excluded]
+        if not positions:
+            raise NoItemsLeftException(NO_ITEMS_LEFT_MSG)
+        cum = list(accumulate(self._weights[i] for i in positions))
+        self._cum_table = (positions, cum)
+        i = bisect(cum, random.random() * cum[-1], 0, len(cum) - 1)
+        return elems[positions[i]]
+
     def shuffle (self):
         """Shuffles all the objects in the list"""
-        return random.shuffle(self.items)
+        # Keeps to the `random` module state, so `random.seed()` applies.
+        items = list(self.items)
+        random.shuffle(items)
+        self.items = items
 
     def choice (self, k=1, no_repeat=False, age=False):
         """Returns `k` randomly generated elements from the list, based on their
@@ -328,85 +632,76 @@ class RandomList (object):
         It only returns the element, never the weight.
 
         """
-        choices = list()
         no_repeat = no_repeat or self._no_repeat
         age = age or self._always_age
-        repeated = self._repeated_cache     # List of repeated elements.
-        for _ in range(k):
-            # Filtering 0 weights
-            allowed = list(filter(lambda x: x[1] > 0.0, self.items))
-            # Filtering non-repeated
-            if no_repeat:
-                allowed = list(filter(lambda x: x[0] not in repeated, allowed))
-
-            # Checking there are still elements where to chose
-            if not allowed:
-                raise NoItemsLeftException("RandomList has no items left to "\
-                                           "return (perhaps you need to clear "\
-                                           "the repeated cache?)")
-
-            # Running the algorithm
-            random.shuffle(allowed)
-            total_weight = sum([x[1] for x in allowed])
-            rndval = random.uniform(0.0, total_weight)
-            rmin = 0.0
-            rmax = 0.0
-            choice = None
-            for elem in allowed:
-                item = elem[0]
-                weight = elem[1]
-                rmax += weight
-                if (rmin <= rndval < rmax):
-                    choice = item
-                    break
+        if not (no_repeat or age):
+            # Nothing changes between draws, so all of them are made at once.
+            self._ensure_tables()
+            if not self._cum_elems:
+                raise NoItemsLeftException(NO_ITEMS_LEFT_MSG)
+            self._last = random.choices(self._cum_elems,
+                                        cum_weights=self._cum_weights, k=k)
+            return self._last.copy()
+
+        choices = list()
+        repeated = self._repeated_cache         # Set of repeated elements.
+        try:
+            if not no_repeat or self._ensure_lookup():
+                repeated = set(repeated)
             else:
-                choice = allowed[-1][0]
+                repeated = list(repeated)       # Unhashable elements.
+        except TypeError:
+            repeated = list(repeated)
+        self._last = choices                    # Grows with each choice.
+        self._cum_table = None                  # May miss allowed elements.
+        for _ in range(k):
+            choice = self._draw(repeated if no_repeat else None)
             choices.append(choice)
 
             # Saving extra parameters
-            self._last = choices.copy()
-            if no_repeat:
+            if no_repeat and isinstance(repeated, set):
+                repeated.add(choice)
+            elif no_repeat:
                 repeated.append(choice)
             if age:
                 self.age()
 
         if self._no_repeat:
-            self._repeated_cache += repeated
+            self._repeated_cache = repeated
 
-        return choices
+        return choices.copy()
 
     def uchoice (self, k=1, no_repeat=False):
         """Uniform choice, ignoring specific weights.
 
         Does not have into account any global repeatition nor aging configuration
 
-        """
-        elems = self.elems()
-        repeated = list()
-        choices = list()
-        for _ in range(k):
-            if no_repeat:
-                allowed = list(filter(lambda x: x not in repeated, elems))
-            else:
-                allowed = elems
-            choice = random.choice(allowed)
-            repeated.append(choice)
-            choices.append(choice)
+        If `no_repeat` is set to True, no position in the list will be chosen
+        twice.
 
-        return choices
+        """
+        if no_repeat:
+            return random.sample(self.elems(), k)
+        else:
+            return random.choices(self.elems(), k=k)
 
 
     # Modificators
+    def _set_weights (self, weights):
+        """Replaces all the weights in the list, keeping the elements"""
+        self._weights = weights
+        self._dirty = True
+
     def uniform (self):
         """Makes all objects have the same weight"""
-        for elem in self.items:
-            elem[1] = 1/len(self.items)
+        n = len(self._elems)
+        if n:
+            self._set_weights([1/n] * n)
 
     def normalize (self):
         """Normalizes the weights of each item from 0 to 1"""
-        suma = sum([x[1] for x in self.items])
-        for elem in self.items:
-            elem[1] /= suma
+        suma = sum(self._weights)
+        self._set_weights([w / suma for w in self._weights])
 
     def age (self):
         """Makes all the items, except from the lasts chosen increase their
@@ -414,12 +709,18 @@ class RandomList (object):
 
         It normalizes the value between 0 and 1.
 
+        The first time, it saves the current weights so they can be recovered
+        with `reset_aging`.
+
         """
-        for item in self.items:
-            # If item not in last choices, increase
-            if item[0] not in self._last:
-                item[1] *= self._aging_coef
-        self.normalize()
+        if not self._backup:
+            self._backup = (self._elems.copy(), self._weights.copy())
+        last = set(self._last) if self._ensure_lookup() else self._last
+        coef = self._aging_coef
+        weights = [w if elem in last else w * coef
+                   for elem, w in zip(self._elems, self._weights)]
+        suma = sum(weights)
+        self._set_weights([w / suma for w in weights])
 
     def configure (self, **kwargs):
         """Configures some parameters and behaviors of the class. Options are:
@@ -437,28 +738,26 @@ class RandomList (object):
         self._always_age = kwargs.get('always_age', self._always_age)
         self._aging_coef = kwargs.get('aging_coef', self._aging_coef)
 
-        if self._always_age:
-            self._backup = self.items.copy()    # Backup for resetting
-
 
     # Resetting methods
     def reset_repeated (self):
-        """Resets the repeated list"""
-        self.repeated = list()
+        """Resets the repeated cache"""
+        self._repeated_cache = set()
 
     def reset_aging (self):
         """Resets the weights of the elements before start aging"""
         if self._backup:
-            self.items = self._backup
-            self._backup = list()
+            self._elems, self._weights = self._backup
+            self._backup = None
+            self._reorder()
 
 
     # Output and testing methods
     def __repr__ (self):
-        return f"RandomList({self.items})"
+        return f"RandomList({list(self.items)})"
 
     def __str__ (self):
-        return str(self.items)
+        return str(list(self.items))
 
 
 class RandomGenerator (RandomList, Generator):
@@ -479,5 +778,5 @@ class RandomGenerator (RandomList, Generator):
         raise StopIteration
 
     def __repr__ (self):
-        return f"RandomGenerator({self.items})"
+        return f"RandomGenerator({list(self.items)})"
 
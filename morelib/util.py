@@ -14,8 +14,8 @@
         For dict handling:
             djoin() -> dict: Joins two or more dictionaries safelly, which means
                 repeated keys between dicts won't be overriden, but added.
-            dsort() -> OrderedDict: Sorts a given dictionary by a given key, and
-                returns an OrderedDict to preserve the order.
+            dsort() -> dict: Sorts a given dictionary by a given key, and
+                returns a dict (or an OrderedDict) in that order.
 
         For string handling:
             cleansplit() -> *str: Splits a string and returns the substrings
@@ -50,13 +50,41 @@
 
 
     Created:        20 Sep 2020
-    Last modified:  24 Sep 2020
+    Last modified:  15 Oct 2026
         - Ready for version 0.1.0
         - Fixed the docs for DataList.
+        - DataList looks its items up in a dictionary.
+        - Faster weight updates in DataList.
+        - DataList weights are updated lazily.
+        - multisorted() is no longer recursive.
+        - multisplit() splits with a single regular expression.
+        - DataList resolves the `returns` keyword once per string.
+        - DataList reads the returned attributes with `attrgetter`.
+        - djoin() looks each key up only once.
+        - ranked() groups items with `itertools.groupby`.
+        - Biter forward() and backward() don't copy the list, and accept 0.
+        - Biter copies its iterable with `list()`.
+        - DataList.elements() doesn't build a list per item.
+        - Globale keeps its user-defined names in a set.
+        - DataList.rank() converts every group with the same function.
+        - Local aliases in the DataList adding loops.
+        - DataItems use slots.
+        - dsort() returns a plain dict, unless asked for an OrderedDict.
+        - nsplit() stops splitting at the wanted occurrence.
+        - multisplit() uses `str.split` for a single substring.
+        - distributed() fills a `defaultdict`.
+        - Singleton looks its instances up only once.
 
 """
+import re
 from collections.abc import Iterable
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from itertools import chain, groupby, islice, repeat
+from operator import attrgetter
+
+
+_MISSING = object()     # Sentinel for missing dictionary keys.
 
 
 #
@@ -83,28 +111,32 @@ def djoin (x, y, *args, **kwargs):
     values can't be joined.
 
     """
-    each = [x, y, *args]
-    ret = dict()
+    ret = dict(x)
     oper = kwargs.get('key')
-    for d in each:
+    for d in (y, *args):
         for key, value in d.items():
-            if key not in ret.keys():
+            current = ret.get(key, _MISSING)
+            if current is _MISSING:
                 ret[key] = value
+            elif oper:
+                ret[key] = oper(current, value)
             else:
-                if oper:
-                    ret[key] = oper(ret[key], value)
-                else:
-                    try:
-                        ret[key] += value
-                    except TypeError:
-                        raise TypeError("dict_join() needs same-key values to "\
-                                        "be addible")
+                try:
+                    ret[key] = current + value
+                except TypeError:
+                    raise TypeError("dict_join() needs same-key values to "\
+                                    "be addible")
     return ret
 
-def dsort (d, key=None, reverse=False):
-    """Sorts a dictionary and returns an OrderedDict with the sort made"""
+def dsort (d, key=None, reverse=False, ordered=False):
+    """Sorts a dictionary and returns a new dictionary with the sort made.
+
+    Dictionaries keep their insertion order since Python 3.7, so a plain dict
+    is returned; set `ordered` to True to get an OrderedDict instead.
+
+    """
     ds = sorted(d.items(), key=key, reverse=reverse)
-    return OrderedDict(ds)
+    return OrderedDict(ds) if ordered else dict(ds)
 
 
 #   String-related
@@ -112,31 +144,55 @@ def cleansplit (string, chars):
     """Splits a the given `string` by `chars` and returns the substrings stripped"""
     return tuple([ss.strip() for ss in string.split(chars)])
 
+@lru_cache(maxsize=64)
+def _multisplit_pattern (subs):
+    """Compiles a regular expression matching any of the substrings in `subs`.
+
+    Longer substrings go first, so they win over any shorter one starting at
+    the same position.
+
+    """
+    if '' in subs:
+        raise ValueError("empty separator")
+    subs = sorted(subs, key=len, reverse=True)
+    return re.compile('|'.join(map(re.escape, subs)))
+
 def multisplit (string, subs):
     """Given a `string` and an iterable of strings, it splits the string by
-    each one of the substrings, and returns a tuple with them in order.
+    each one of the substrings, and returns a tuple with them in order,
+    stripped.
+
+    The string is stripped first, so leading or trailing separators do not
+    yield empty tokens. It is then scanned from left to right, splitting it at
+    every separator found; if several separators start at the same position,
+    the longest one is taken. So, `multisplit('ab--', ['ab', 'b'])` returns
+    `('', '--')`.
 
     """
-    try:
-        sub = subs[0]
-    except IndexError:
+    subs = tuple(subs)
+    if not subs:
         return (string,)
-    else:
-        tokens = multisplit(string, subs[1:])
-        splitted = list()
-        for token in tokens:
-            token = token.strip()
-            splitted += token.split(sub)
-        return tuple(splitted)
+    elif len(subs) == 1:
+        return cleansplit(string.strip(), subs[0])
+    pattern = _multisplit_pattern(subs)
+    return tuple([token.strip() for token in pattern.split(string.strip())])
 
 def nsplit (string, chars, n):
     """Splits the given `string` in two slices, one before the `n` occurence
     of `chars`, and the other after it.
 
     """
-    slices = string.split(chars)
-    before, after = lcut(slices, n+1)
-    return chars.join(before).strip(), chars.join(after).strip()
+    if n < 0:
+        # Counting from the end, as list indexes do.
+        slices = string.split(chars)
+        before, after = lcut(slices, n+1)
+        return chars.join(before).strip(), chars.join(after).strip()
+    slices = string.split(chars, n+1)
+    if len(slices) <= n+1:
+        # Not enough occurrences, everything goes before.
+        return string.strip(), ''
+    cut = len(string) - len(slices[-1]) - len(chars)
+    return string[:cut].strip(), slices[-1].strip()
 
 
 #   Others types
@@ -157,29 +213,16 @@ def multisorted (l, key=None, reverse=False):
     # Checking the key
     if isinstance(key, (list, tuple)):
         # List of keys is default behavior.
-        current_key = key[0]
-        more_keys = key[1:]
+        keys = key
     else:
         # Empty or unique key will make the it act as it if were just `sorted`.
-        current_key = key or (lambda x: x)
-        more_keys = list()
-
-    # Running the algorithm
-    chance = ranked(l, key=current_key, reverse=reverse)
-    #print(" ## ", chance, current_key, more_keys)
-    ms = list()
-    for equals in chance:
-        if len(equals) > 1:
-            # We check if there are more keys to call
-            if len(more_keys) >= 1:
-                # Call this function again to sort this sublist.
-                again = multisorted(equals, key=more_keys, reverse=reverse)
-                ms += again
-            else:
-                # No more keys left, the sublist is left the same.
-                ms += list(equals)
-        else:
-            ms.append(equals[0])
+        keys = [key]
+
+    # Sorting is stable, so sorting by the last key first and by the first key
+    # last leaves the draws of each key sorted by the following ones.
+    ms = list(l)
+    for current_key in reversed(keys):
+        ms.sort(key=current_key, reverse=reverse)
     return ms
 
 
@@ -194,20 +237,8 @@ def ranked (l, key=None, reverse=False, cmpkey=None):
 
     """
     sl = sorted(l, key=key, reverse=reverse)
-    compare = cmpkey or (key or (lambda x: x))
-    rl = list()         # Final list of values
-    chain = [sl[0]]     # Here will save equal-valued items.
-    prev_item = sl[0]   # To compare with the next one and check equality.
-    for item in sl[1:]:
-        if compare(item) == compare(prev_item):
-            chain.append(item)
-        else:
-            rl.append(tuple(chain))
-            chain = [item]
-        prev_item = item
-    if chain:
-        rl.append(tuple(chain))
-    return rl
+    compare = cmpkey or key     # None compares the items themselves.
+    return [tuple(group) for _, group in groupby(sl, key=compare)]
 
 
 def distributed (l, key=None, no_errors=False):
@@ -222,7 +253,7 @@ def distributed (l, key=None, no_errors=False):
     return result of the function and saved too.
 
     """
-    dret = dict()
+    dret = defaultdict(list)
     key = key or (lambda x: x)
     for item in l:
         try:
@@ -232,10 +263,8 @@ def distributed (l, key=None, no_errors=False):
                 ans = type(e)
             else:
                 raise
-        if ans not in dret:
-            dret[ans] = list()
         dret[ans].append(item)
-    return dret
+    return dict(dret)
 
 
 
@@ -253,9 +282,11 @@ class Singleton (type):
     """
     _instances = {}
     def __call__ (cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
-        return cls._instances[cls]
+        instance = Singleton._instances.get(cls, _MISSING)
+        if instance is _MISSING:
+            instance = super(Singleton, cls).__call__(*args, **kwargs)
+            Singleton._instances[cls] = instance
+        return instance
 
 
 #
@@ -280,21 +311,20 @@ class Globale (object, metaclass=Singleton):
 
     """
     def __init__ (self):
-        self.__dict__['_vars'] = dict()
-        self.__dict__['__user_defined__'] = list()
+        object.__setattr__(self, '_vars', dict())
+        object.__setattr__(self, '__user_defined__', set())
 
     def __setattr__ (self, varname, value):
-        self.__dict__['_vars'][varname] = value
-        self.__dict__['__user_defined__'].append(varname)
+        self._vars[varname] = value
+        self.__user_defined__.add(varname)
 
     def __getattr__ (self, varname):
-        if varname not in self.__dict__['_vars']:
-            return None
-        else:
-            return self.__dict__['_vars'][varname]
+        # Only called for missing attributes, which are the stored variables.
+        # `__dict__` is used to avoid recursion if `_vars` is not there yet.
+        return self.__dict__['_vars'].get(varname)
 
     def is_user_defined (self, varname):
-        return varname in self.__dict__['__user_defined__']
+        return varname in self.__user_defined__
 
 globale = Globale()     # Main instance
 
@@ -321,9 +351,9 @@ class Biter (object):
         index() -> int: Returns the current elements index.
         len() -> int: Returns the size of the list.
 
-        forward() -> generator: Returns a generator that will go from the
+        forward() -> iterator: Returns an iterator that will go from the
             position given to the last one.
-        backward() -> generator: Returns a generator that will go from the
+        backward() -> iterator: Returns an iterator that will go from the
             position given to the first one.
 
     Raises:
@@ -332,7 +362,7 @@ class Biter (object):
     """
     def __init__ (self, iterable, pos=0):
         """Constructs from the iterable"""
-        self._iter = [item for item in iterable]
+        self._iter = list(iterable)
         self._pos = pos
         self.current = self._iter[self._pos]
 
@@ -370,31 +400,70 @@ class Biter (object):
         return len(self._iter)
 
     def forward (self, pos=None):
-        """Returns a forward generator from this iter.
+        """Returns a forward iterator from this iter.
 
         If a `pos` is given, it will start from there, if not, it will do from
         the current position; both till the end.
 
         """
-        pos = pos or self._pos
-        return (item for item in self._iter[pos:])
+        pos = self._pos if pos is None else pos
+        if pos < 0:
+            pos = max(pos + len(self), 0)
+        return islice(self._iter, pos, None)
 
     def backward (self, pos=None):
-        """Returns a backward generator from this iter.
+        """Returns a backward iterator from this iter.
 
         If a `pos` is given, it will start from there, if not, it will do from
         the current position; both till the start.
 
         """
-        pos = pos or self._pos
-        return (item for item in self._iter[pos::-1])
+        pos = self._pos if pos is None else pos
+        if pos < 0:
+            pos += len(self)
+        pos = min(pos, len(self) - 1)
+        return map(self._iter.__getitem__, range(pos, -1, -1))
 
     def __repr__ (self):
         return f"Biter({self._iter})"
 
 
 
+_RETURNS_PLACEHOLDERS = {'all': 'item|count|weight',
+                         'basic': 'item|count',
+                         'stats': 'item|weight'}
+_RETURNS_TOKENS = ('dataitem', 'item', 'count', 'weight')
+
+def _resolve_returns (returns):
+    """Turns a DataList `returns` string into a tuple with its known tokens"""
+    returns = _RETURNS_PLACEHOLDERS.get(returns, returns)
+    return tuple([token for token in cleansplit(returns, '|')
+                  if token in _RETURNS_TOKENS])
+
+@lru_cache(maxsize=64)
+def _returns_converter (returns):
+    """Returns a function that turns an iterable of DataItems into a list with
+    what the DataList `returns` string asks for.
+
+    """
+    return_tokens = _resolve_returns(returns)
+    if return_tokens == ('dataitem',):
+        return list
+    elif not return_tokens:
+        return lambda items: [() for _ in items]
+    elif 'dataitem' not in return_tokens:
+        # One token gives the attribute itself, more give a tuple.
+        getter = attrgetter(*return_tokens)
+        return lambda items: list(map(getter, items))
+    else:
+        return lambda items: [tuple([dataitem if token == 'dataitem'
+                                     else getattr(dataitem, token)
+                                     for token in return_tokens])
+                              for dataitem in items]
+
 class _DataItem (object):
+    __slots__ = ('item', 'count', 'weight')
+
     def __init__ (self, i, c, w):
         self.item = i
         self.count = c
@@ -448,35 +517,69 @@ class DataList (object):
 
         """
         self._items = list()
+        self._index = dict()        # Hashable item to its DataItem.
         self._total = 0
+        self._dirty = False         # Total and weights must be recomputed.
         self.update(*args, **kwargs)
 
+    def _find (self, item):
+        """Returns the DataItem of the given `item`, or None if it is not in
+        the list.
+
+        Hashable items are found in the index dictionary; the others need to
+        be compared against every item in the list.
+
+        """
+        try:
+            return self._index.get(item)
+        except TypeError:
+            for dataitem in self._items:
+                if dataitem.item == item:
+                    return dataitem
+            return None
+
 
     # Update methods
     def _item_only_update (self, *args, **kwargs):
+        add = self.add
         if len(args) == 1:
             if isinstance(args[0], dict):
                 for key, cnt in args[0].items():
-                    self.add(key, cnt)
+                    add(key, cnt)
             else:
                 for item in args[0]:
                     if isinstance(item, (list, tuple)):
-                        self.add(item[0], item[1])
+                        add(item[0], item[1])
                     else:
-                        self.add(item)
+                        add(item)
         else:
             for arg in args:
-                self.add(arg)
+                add(arg)
         for key, cnt in kwargs.items():
-            self.add(key, cnt)
+            add(key, cnt)
 
     def _weight_update (self):
-        self._total = sum(map(lambda x: x.count, self._items))
-        for i in range(len(self._items)):
-            try:
-                self._items[i].weight = self._items[i].count / self._total
-            except ZeroDivisionError:
-                self._items[i].weight = 0.0
+        # Counts live in the DataItems handed to user keys, not in a numeric
+        # array, so there is nothing here for NumPy or a JIT to fuse; the
+        # comprehension beats `map(attrgetter)` for the sum, and the lazy
+        # `_dirty` flag already keeps this to one pass per batch of changes.
+        items = self._items
+        self._total = total = sum([dataitem.count for dataitem in items])
+        if total:
+            for dataitem in items:
+                dataitem.weight = dataitem.count / total
+        else:
+            for dataitem in items:
+                dataitem.weight = 0.0
+        self._dirty = False
+
+    def _ensure_fresh (self):
+        """Updates the total and the weights, if any count has changed since
+        the last time they were computed.
+
+        """
+        if self._dirty:
+            self._weight_update()
 
     def update (self, *args, **kwargs):
         """Extends the construction to new items. As it, it allows:
@@ -488,16 +591,12 @@ class DataList (object):
 
         If keys are repeated, their values won't be overriden, but added.
 
-        Also, after adding a new item or modifying one of the existing, it
-        updates the total score and the weights of each item.
+        The total score and the weights of each item are not updated until
+        they are needed again, so adding many items costs one update only.
 
         """
-        # Adding
         self._item_only_update(*args, **kwargs)
 
-        # Updating
-        self._weight_update()
-
 
     # Standard operations
     def add (self, new_item, init_count=0.0):
@@ -508,13 +607,18 @@ class DataList (object):
         added to the current count.
 
         """
-        init_count = 0.0 if init_count < 0 else init_count
-        for dataitem in self._items:
-            if dataitem.item == new_item:
-                dataitem.count += float(init_count)
-                break
+        init_count = 0.0 if init_count < 0 else float(init_count)
+        self._dirty = True
+        dataitem = self._find(new_item)
+        if dataitem is not None:
+            dataitem.count += init_count
         else:
-            self._items.append(_DataItem(new_item, float(init_count), None))
+            dataitem = _DataItem(new_item, init_count, None)
+            self._items.append(dataitem)
+            try:
+                self._index[new_item] = dataitem
+            except TypeError:
+                pass                # Unhashable, only in the list.
         return self
 
     def subtract (self, old_item, cnt=None):
@@ -526,49 +630,33 @@ class DataList (object):
         If `old_item` is not in the list, it does nothing.
 
         """
-        for i in range(len(self._items)):
-            if self._items[i].item == old_item:
-                if cnt is None:
-                    del self._items[i]    # Item is deleted
-                    break
-                else:
-                    self._items[i].count -= float(cnt)
-        self._weight_update()
+        dataitem = self._find(old_item)
+        if dataitem is not None:
+            if cnt is None:
+                # Item is deleted
+                self._items.remove(dataitem)
+                try:
+                    del self._index[old_item]
+                except (KeyError, TypeError):
+                    pass
+            else:
+                dataitem.count -= float(cnt)
+            self._dirty = True
         return self
 
     def clear (self):
         """Resets to 0 all the counters"""
         for dataitem in self._items:
             dataitem.count = 0.0
-        self._weight_update()
+        self._dirty = True
         return self
 
 
     # Set / Get operations.
     def _group_items (self, items, returns):
         """Given a list of DataItem items, returns the correct attributes"""
-        _returns_placeholders = {'all': 'item|count|weight',
-                                 'basic': 'item|count',
-                                 'stats': 'item|weight'}
-        returns = _returns_placeholders.get(returns, returns)
-        return_tokens = cleansplit(returns, '|')
-        ret = list()
-        for dataitem in items:
-            retobj = list()
-            for token in return_tokens:
-                if token == 'dataitem':
-                    retobj.append(dataitem)
-                elif token == 'item':
-                    retobj.append(dataitem.item)
-                elif token == 'count':
-                    retobj.append(dataitem.count)
-                elif token == 'weight':
-                    retobj.append(dataitem.weight)
-            if len(retobj) == 1:
-                ret.append(retobj[0])
-            else:
-                ret.append(tuple(retobj))
-        return ret
+        self._ensure_fresh()
+        return _returns_converter(returns)(items)
 
     def items (self, returns='dataitem'):
         """Returns the current list of items.
@@ -594,8 +682,8 @@ class DataList (object):
 
     def elements (self):
         """Returns a list with the items only, repeated each `total` times"""
-        from itertools import chain
-        return list(chain(*[[x.item]*int(x.count) for x in self._items]))
+        return list(chain.from_iterable(repeat(x.item, int(x.count))
+                                        for x in self._items))
 
     def counts (self):
         """Returns a list of tuples (item, count)"""
@@ -606,6 +694,7 @@ class DataList (object):
         return self.items('weight')
 
     def total (self):
+        self._ensure_fresh()
         return self._total
 
 
@@ -618,16 +707,15 @@ class DataList (object):
         If everything fails, it will return None.
 
         """
-        for dataitem in self._items:
-            if dataitem.item == key:
-                return dataitem.count
-        else:
-            if isinstance(key, int):
-                try:
-                    return self._items[key].count
-                except IndexError:
-                    return None
-        self._weight_update()
+        dataitem = self._find(key)
+        if dataitem is not None:
+            return dataitem.count
+        elif isinstance(key, int):
+            try:
+                return self._items[key].count
+            except IndexError:
+                return None
+        return None
 
     def set (self, key, value):
         """Forces the count of a given key to be `value`.
@@ -641,17 +729,17 @@ class DataList (object):
 
         """
         value = 0.0 if (value < 0) else value
-        for dataitem in self._items:
-            if dataitem.item == key:
-                dataitem.count = value
-                break
+        dataitem = self._find(key)
+        if dataitem is not None:
+            dataitem.count = value
+        elif isinstance(key, int):
+            try:
+                self._items[key].count = value
+            except IndexError:
+                self.add(key, value)
         else:
-            if isinstance(key, int):
-                try:
-                    dataitem.count = value
-                except IndexError:
-                    self.add(key, value)
-        self._weight_update()
+            self.add(key, value)
+        self._dirty = True
 
     def __getitem__ (self, key):
         return self.get(key)
@@ -673,6 +761,7 @@ class DataList (object):
         you want to receive, following the system provided at `self.items()`.
 
         """
+        self._ensure_fresh()
         fitems = filter(key, self._items)
         return self._group_items(fitems, returns)
 
@@ -690,21 +779,25 @@ class DataList (object):
         as with `self.items()`.
 
         """
+        convert = _returns_converter(returns)
+        return [tuple(convert(group))
+                for group in self._ranked_groups(key, reverse)]
+
+    def _ranked_groups (self, key, reverse):
+        """Ranks the DataItems, as `rank()` does, without converting them"""
+        self._ensure_fresh()
         key = key or (lambda x: x.count)
-        rlist = ranked(self._items, key=key, reverse=reverse)
-        retlist = list()
-        for chained in rlist:
-            fixed = self._group_items(chained, returns)
-            retlist.append(tuple(fixed))
-        return retlist
+        return ranked(self._items, key=key, reverse=reverse)
 
     def top (self, key=None, reverse=False, returns='dataitem'):
         """Returns the top ranked DataItems"""
-        return self.rank(key, reverse, returns)[0]
+        group = self._ranked_groups(key, reverse)[0]
+        return tuple(_returns_converter(returns)(group))
 
     def bottom (self, key=None, reverse=False, returns='dataitem'):
         """Returns the bottom ranked DataItems"""
-        return self.rank(key, reverse, returns)[-1]
+        group = self._ranked_groups(key, reverse)[-1]
+        return tuple(_returns_converter(returns)(group))
 
     def sort (self, key=None, reverse=False, returns='dataitem'):
         """Returns the items in this list sorted.
@@ -724,6 +817,7 @@ class DataList (object):
         as with `self.items()`.
 
         """
+        self._ensure_fresh()
         key = key or (lambda x: x.count)
         slist = multisorted(self._items, key=key, reverse=reverse)
         return self._group_items(slist, returns)
@@ -734,6 +828,7 @@ class DataList (object):
         return f"DataList({', '.join(str(di) for di in self.items())})"
 
     def __str__ (self):
+        self._ensure_fresh()
         out = ""
         out += "DataList {\n"
         for di in self._items: